@@ -1,29 +1,149 @@
 # project1.py
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Depends
 from pydantic import BaseModel
-from github import Github, GithubException
-import os, uuid, base64, requests, datetime, time
+from github import Github, GithubException, UnknownObjectException
+from urllib3.util.retry import Retry
+from functools import lru_cache
+from contextlib import asynccontextmanager
+from urllib.parse import unquote
+import os, re, hashlib, secrets, datetime, asyncio, random, html
+import httpx
+import orjson
+import msgspec
 from dotenv import load_dotenv
 
+# pybase64 (SIMD) is a drop-in for the stdlib codec when installed
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 # -------------------------------
 # ENV
 # -------------------------------
 load_dotenv()
 SECRET = os.getenv("SECRET")
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
-GITHUB_USERNAME = os.getenv("GITHUB_USERNAME")
-if not SECRET or not GITHUB_TOKEN or not GITHUB_USERNAME:
-    raise Exception("Set SECRET, GITHUB_TOKEN, and GITHUB_USERNAME in .env")
+if not SECRET or not GITHUB_TOKEN:
+    raise Exception("Set SECRET and GITHUB_TOKEN in .env")
+
+GITHUB_API = "https://api.github.com"
+# Request bodies are pre-serialized with orjson and sent as raw content
+JSON_HEADERS = {"Content-Type": "application/json"}
+GITHUB_HEADERS = {
+    "Authorization": f"Bearer {GITHUB_TOKEN}",
+    "Accept": "application/vnd.github+json",
+    **JSON_HEADERS
+}
+
+# Shared PyGithub client; its Requester keeps one pooled session, so the
+# TLS handshake to api.github.com is paid once per process
+GITHUB_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+GH = Github(GITHUB_TOKEN, per_page=100, pool_size=50, retry=GITHUB_RETRY)
+
+@lru_cache(maxsize=1)
+def gh_user():
+    return GH.get_user()
+
+# (task_lower, email) -> repo name, persisted as append-only JSONL
+REPO_INDEX_PATH = "repo_index.jsonl"
+REPO_INDEX = {}
 
 # -------------------------------
 # APP
 # -------------------------------
-app = FastAPI(title="Project1 API")
+def load_repo_index():
+    try:
+        with open(REPO_INDEX_PATH) as f:
+            for line in f:
+                entry = orjson.loads(line)
+                REPO_INDEX[(entry["task"], entry["email"])] = entry["repo"]
+    except FileNotFoundError:
+        pass
+
+LOG_BATCH_SIZE = 256
+
+# fdatasync skips the metadata flush where the platform supports it
+fdatasync = getattr(os, "fdatasync", os.fsync)
+
+async def log_writer(queue: asyncio.Queue):
+    """Single writer for all JSONL logs; a None item stops it"""
+    files = {}
+
+    def write_batch(batch):
+        for path, lines in batch.items():
+            if path not in files:
+                files[path] = open(path, "ab", buffering=64 * 1024)
+            fh = files[path]
+            fh.write(b"".join(lines))
+            fh.flush()
+            # One sync per batch rather than one per record
+            fdatasync(fh.fileno())
+
+    try:
+        stop = False
+        while not stop:
+            # Take up to LOG_BATCH_SIZE queued records and write them in one go
+            item = await queue.get()
+            batch, count = {}, 0
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                batch.setdefault(item[0], []).append(item[1])
+                count += 1
+                if count >= LOG_BATCH_SIZE or queue.empty():
+                    break
+                item = queue.get_nowait()
+            if batch:
+                # Disk I/O runs in a worker thread so the event loop stays free
+                await asyncio.to_thread(write_batch, batch)
+    finally:
+        for fh in files.values():
+            fh.close()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    load_repo_index()
+    app.state.log_queue = asyncio.Queue()
+    app.state.log_task = asyncio.create_task(log_writer(app.state.log_queue))
+    # One pooled client for all outbound HTTP, shared across requests
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    )
+    # GitHub traffic gets its own HTTP/2 client so concurrent API calls
+    # multiplex over one connection to api.github.com
+    app.state.gh = httpx.AsyncClient(
+        base_url=GITHUB_API,
+        http2=True,
+        timeout=10,
+        headers=GITHUB_HEADERS,
+        limits=httpx.Limits(max_keepalive_connections=20)
+    )
+    try:
+        # Warm both GitHub connection pools and validate the token at boot;
+        # the login from /user replaces a separately configured username
+        r, _ = await asyncio.gather(
+            app.state.gh.get("/user"),
+            asyncio.to_thread(lambda: gh_user().login)
+        )
+        r.raise_for_status()
+        app.state.gh_login = r.json()["login"]
+        yield
+    finally:
+        await app.state.http.aclose()
+        await app.state.gh.aclose()
+        app.state.log_queue.put_nowait(None)
+        await app.state.log_task
+
+app = FastAPI(title="Project1 API", lifespan=lifespan)
 
 # -------------------------------
 # MODELS
 # -------------------------------
-class TaskRequest(BaseModel):
+class TaskRequest(msgspec.Struct):
     email: str
     secret: str
     task: str
@@ -43,128 +163,376 @@ class EvaluateRequest(BaseModel):
     commit_sha: str
     pages_url: str
 
+async def parse_task_request(req: Request) -> TaskRequest:
+    """Decode the /task body straight into TaskRequest with msgspec"""
+    try:
+        # strict=False keeps the lax coercion clients relied on under pydantic
+        return msgspec.json.decode(await req.body(), type=TaskRequest, strict=False)
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 # -------------------------------
 # HELPERS
 # -------------------------------
+def log_event(path: str, record: dict):
+    """Queue one JSONL record for the background log writer"""
+    line = orjson.dumps(
+        {"ts": datetime.datetime.now().isoformat(), **record},
+        option=orjson.OPT_APPEND_NEWLINE
+    )
+    app.state.log_queue.put_nowait((path, line))
+
+def log_raw_event(path: str, raw: bytes):
+    """Queue an already-validated JSON body as {"ts", "payload"} without re-encoding it"""
+    # Literal newlines can only be insignificant whitespace in valid JSON
+    if b"\n" in raw or b"\r" in raw:
+        raw = raw.replace(b"\n", b"").replace(b"\r", b"")
+    ts = datetime.datetime.now().isoformat().encode("ascii")
+    app.state.log_queue.put_nowait((path, b'{"ts":"' + ts + b'","payload":' + raw + b'}\n'))
+
 def verify_secret(secret: str):
-    if secret != SECRET:
+    if not secrets.compare_digest(secret.encode("utf-8"), SECRET.encode("utf-8")):
         raise HTTPException(status_code=403, detail="Invalid secret")
 
+# Runs of characters GitHub won't keep in a repo name
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+def repo_prefix(task_name: str, email: str):
+    task_part = _UNSAFE_NAME_RE.sub("-", task_name.lower())
+    email_part = _UNSAFE_NAME_RE.sub("-", email.replace(".", "-"))
+    return f"{task_part}-{email_part}"
+
+def repo_name_for(task_name: str, email: str):
+    """Deterministic repo name, so every round of a task maps to one repo"""
+    suffix = hashlib.blake2b(f"{task_name.lower()}:{email}".encode(), digest_size=4).hexdigest()
+    return f"{repo_prefix(task_name, email)}-{suffix}"
+
+def search_github_repo(task_name: str, email: str):
+    """Find a repo created with the old random suffix via the search API"""
+    prefix = repo_prefix(task_name, email)
+    try:
+        # Search is rate limited separately (30/min); one page is plenty
+        for repo in GH.search_repositories(f"{prefix} in:name user:{app.state.gh_login}").get_page(0):
+            if repo.name.startswith(prefix):
+                return repo
+    except GithubException as e:
+        print("Repo search error:", e)
+    return None
+
 def get_github_repo(task_name: str, email: str):
     """Return existing repo if exists, else None"""
-    g = Github(GITHUB_TOKEN)
-    user = g.get_user()
-    prefix = f"{task_name.lower()}-{email.replace('@','-').replace('.','-')}"
-    for repo in user.get_repos():
-        if repo.name.startswith(prefix):
-            return repo
-    return None
+    indexed = REPO_INDEX.get((task_name.lower(), email))
+    try:
+        return GH.get_repo(f"{app.state.gh_login}/{indexed or repo_name_for(task_name, email)}")
+    except UnknownObjectException:
+        if indexed:
+            return None
+    repo = search_github_repo(task_name, email)
+    if repo:
+        record_github_repo(task_name, email, repo.name)
+    return repo
+
+def ensure_repo(task_name: str, email: str):
+    """Return (repo, created) for a task, creating the repo on first use"""
+    repo = get_github_repo(task_name, email)
+    if repo:
+        return repo, False
+    try:
+        return create_github_repo(task_name, email), True
+    except GithubException as e:
+        # The name is deterministic, so 422 means a concurrent round won the race
+        if e.status != 422:
+            raise
+        return GH.get_repo(f"{app.state.gh_login}/{repo_name_for(task_name, email)}"), False
+
+def record_github_repo(task_name: str, email: str, repo_name: str):
+    key = (task_name.lower(), email)
+    REPO_INDEX[key] = repo_name
+    # Single O_APPEND write per entry keeps concurrent appends whole
+    with open(REPO_INDEX_PATH, "ab") as f:
+        f.write(orjson.dumps({"task": key[0], "email": email, "repo": repo_name}, option=orjson.OPT_APPEND_NEWLINE))
 
 def create_github_repo(task_name: str, email: str):
-    g = Github(GITHUB_TOKEN)
-    user = g.get_user()
-    repo_name = f"{task_name.lower()}-{email.replace('@','-').replace('.','-')}-{uuid.uuid4().hex[:5]}"
+    user = gh_user()
     repo = user.create_repo(
-        name=repo_name,
+        name=repo_name_for(task_name, email),
         private=False,
         description=f"Auto-generated repo for task {task_name}",
-        auto_init=False
+        # Git Data API needs an initial commit to build on
+        auto_init=True
     )
+    record_github_repo(task_name, email, repo.name)
     return repo
 
-def create_or_update_file(repo, path, content):
-    """Create or update file safely"""
-    try:
-        existing_file = None
-        try:
-            existing_file = repo.get_contents(path)
-        except GithubException as e:
-            if e.status == 404:
-                existing_file = None
-            else:
-                raise
-        if existing_file:
-            repo.update_file(path, f"Update {path}", content, existing_file.sha)
+async def create_blob(repo_full_name: str, encoding: str, content: str):
+    r = await app.state.gh.post(
+        f"/repos/{repo_full_name}/git/blobs",
+        content=orjson.dumps({"content": content, "encoding": encoding})
+    )
+    r.raise_for_status()
+    return r.json()["sha"]
+
+REPO_HEAD_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef { name target { oid ... on Commit { tree { oid } } } }
+  }
+}
+"""
+
+async def get_repo_head(repo_full_name: str):
+    """Return (default branch, head commit SHA, head tree SHA) in one GraphQL call"""
+    owner, name = repo_full_name.split("/", 1)
+    r = await app.state.gh.post(
+        "/graphql",
+        content=orjson.dumps({"query": REPO_HEAD_QUERY, "variables": {"owner": owner, "name": name}})
+    )
+    r.raise_for_status()
+    repository = (r.json().get("data") or {}).get("repository")
+    if not repository or not repository["defaultBranchRef"]:
+        raise Exception(f"No default branch for {repo_full_name}: {r.json().get('errors')}")
+    ref = repository["defaultBranchRef"]
+    return ref["name"], ref["target"]["oid"], ref["target"]["tree"]["oid"]
+
+async def push_files_to_repo(repo_full_name: str, files: dict):
+    """Push all files as a single commit via the Git Data API, return its SHA"""
+    repo_api = f"/repos/{repo_full_name}"
+    # Blobs are independent of each other and of the current head
+    head, *blob_shas = await asyncio.gather(
+        get_repo_head(repo_full_name),
+        *(create_blob(repo_full_name, encoding, content) for encoding, content in files.values()),
+        return_exceptions=True
+    )
+    if isinstance(head, Exception):
+        raise head
+    branch, parent_sha, base_tree = head
+    # A rejected blob only drops that file; the rest still get committed
+    uploaded = {}
+    for path, sha in zip(files, blob_shas):
+        if isinstance(sha, Exception):
+            print(f"Blob upload error {path}: {sha}")
         else:
-            repo.create_file(path, f"Add {path}", content)
-    except Exception as e:
-        print(f"Error creating/updating {path}: {e}")
-
-def generate_app_files(brief: str, attachments: list):
-    html_content = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head><meta charset="UTF-8"/><title>{brief}</title></head>
-    <body><h1>{brief}</h1></body>
-    </html>
-    """
+            uploaded[path] = sha
+
+    # base_tree keeps files from earlier rounds that this push doesn't touch
+    r = await app.state.gh.post(f"{repo_api}/git/trees", content=orjson.dumps({
+        "base_tree": base_tree,
+        "tree": [
+            {"path": path, "mode": "100644", "type": "blob", "sha": sha}
+            for path, sha in uploaded.items()
+        ]
+    }))
+    r.raise_for_status()
+    tree_sha = r.json()["sha"]
+
+    r = await app.state.gh.post(f"{repo_api}/git/commits", content=orjson.dumps({
+        "message": f"Update {', '.join(uploaded)}",
+        "tree": tree_sha,
+        "parents": [parent_sha]
+    }))
+    r.raise_for_status()
+    commit_sha = r.json()["sha"]
+
+    r = await app.state.gh.patch(
+        f"{repo_api}/git/refs/heads/{branch}",
+        content=orjson.dumps({"sha": commit_sha})
+    )
+    r.raise_for_status()
+    return commit_sha
+
+MIT_LICENSE_TEXT = """MIT License
+
+Copyright (c) {year} {author}
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+INDEX_HTML_TEMPLATE = (
+    b'<!DOCTYPE html>\n'
+    b'<html lang="en">\n'
+    b'<head><meta charset="UTF-8"/><title>%b</title></head>\n'
+    b'<body><h1>%b</h1></body>\n'
+    b'</html>'
+)
+
+README_TEMPLATE = b"# Auto-generated App\n\n**Brief:** %b\n\nLicense: MIT"
+
+_BASE64_RE = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+
+def _b64(content: bytes):
+    return base64.b64encode(content).decode("ascii")
+
+@lru_cache(maxsize=512)
+def _static_files(brief: str):
+    """(index.html, README.md) for a brief as blob-ready base64"""
+    safe = html.escape(brief).encode("utf-8")
+    index_html = INDEX_HTML_TEMPLATE % (safe, safe)
+    readme = README_TEMPLATE % brief.encode("utf-8")
+    return _b64(index_html), _b64(readme)
+
+@lru_cache(maxsize=8)
+def rendered_license(author: str, year: int):
+    """MIT LICENSE for author/year as blob-ready base64"""
+    return _b64(MIT_LICENSE_TEXT.format_map({"year": year, "author": author}).encode("utf-8"))
+
+def blob_content(data: bytes):
+    """Send text as utf-8 (no base64 inflation); binary data stays base64"""
+    if b"\0" not in data[:4096]:
+        try:
+            return ("utf-8", data.decode("utf-8"))
+        except UnicodeDecodeError:
+            pass
+    return ("base64", _b64(data))
+
+MAX_ATTACHMENT_BYTES = 25 * 1024 * 1024
+
+async def fetch_attachment(url: str):
+    """Download a URL attachment, refusing anything over MAX_ATTACHMENT_BYTES"""
+    async with app.state.http.stream("GET", url, follow_redirects=True) as r:
+        r.raise_for_status()
+        if int(r.headers.get("Content-Length") or 0) > MAX_ATTACHMENT_BYTES:
+            raise ValueError(f"larger than {MAX_ATTACHMENT_BYTES} bytes")
+        chunks, size = [], 0
+        async for chunk in r.aiter_bytes():
+            size += len(chunk)
+            if size > MAX_ATTACHMENT_BYTES:
+                raise ValueError(f"larger than {MAX_ATTACHMENT_BYTES} bytes")
+            chunks.append(chunk)
+    return blob_content(b"".join(chunks))
+
+async def generate_app_files(brief: str, attachments: list):
+    """Return {path: (encoding, content)} ready for the Git blob API"""
+    index_html, readme = _static_files(brief)
     files = {
-        "index.html": html_content.strip(),
-        "README.md": f"# Auto-generated App\n\n**Brief:** {brief}\n\nLicense: MIT",
-        "LICENSE": "MIT License"
+        "index.html": ("base64", index_html),
+        "README.md": ("base64", readme),
+        "LICENSE": ("base64", rendered_license(app.state.gh_login, datetime.date.today().year))
     }
+    remote = []
     for att in attachments:
+        name = None
         try:
+            name = att["name"]
+            if not name:
+                raise ValueError("missing name")
             data = att.get("url")
             if data and data.startswith("data:"):
-                encoded = data.split(",")[1]
-                content = base64.b64decode(encoded).decode("utf-8", errors="ignore")
-                files[att["name"]] = content
+                header, encoded = data.split(",", 1)
+                if header.endswith(";base64"):
+                    # Pass the original base64 straight through to GitHub,
+                    # after a cheap alphabet check instead of a full decode
+                    encoded = unquote(encoded)
+                    if not _BASE64_RE.fullmatch(encoded) or len(encoded) % 4:
+                        raise ValueError("invalid base64 payload")
+                    files[name] = ("base64", encoded)
+                else:
+                    files[name] = ("utf-8", unquote(encoded))
+            elif data:
+                remote.append((name, data))
         except Exception as e:
-            print(f"Attachment error {att.get('name')}: {e}")
+            print(f"Attachment error {name}: {e}")
+    # Remote attachments are downloaded concurrently
+    results = await asyncio.gather(
+        *(fetch_attachment(url) for _, url in remote),
+        return_exceptions=True
+    )
+    for (name, _), result in zip(remote, results):
+        if isinstance(result, Exception):
+            print(f"Attachment error {name}: {result}")
+        else:
+            files[name] = result
     return files
 
-def enable_github_pages(repo):
+async def enable_github_pages(repo):
+    pages_api = f"/repos/{repo.full_name}/pages"
     try:
-        repo.edit(has_pages=True)
-        return f"https://{GITHUB_USERNAME}.github.io/{repo.name}/"
+        # Later rounds already have Pages configured; only POST on a 404
+        r = await app.state.gh.get(pages_api)
+        if r.status_code == 404:
+            r = await app.state.gh.post(pages_api, content=orjson.dumps({
+                "source": {"branch": repo.default_branch, "path": "/"}
+            }))
+        r.raise_for_status()
+        return r.json().get("html_url") or f"https://{app.state.gh_login}.github.io/{repo.name}/"
     except Exception as e:
         print("Pages enable error:", e)
         return None
 
-def post_evaluation(payload: dict, evaluation_url: str):
+def retry_after_seconds(r):
+    """Retry-After in seconds for 429/503 responses, else None"""
+    if r is None or r.status_code not in (429, 503):
+        return None
+    try:
+        return float(r.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+async def post_evaluation(payload: dict, evaluation_url: str):
+    body = orjson.dumps(payload)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + 60
     delay = 1
-    for _ in range(5):
+    for attempt in range(5):
+        r = None
         try:
-            r = requests.post(evaluation_url, json=payload, timeout=10)
+            r = await app.state.http.post(evaluation_url, content=body, headers=JSON_HEADERS)
             if r.status_code == 200:
                 return True
             else:
                 print(f"Eval POST failed {r.status_code}: {r.text}")
         except Exception as e:
             print("Eval POST error:", e)
-        time.sleep(delay)
+        # Jitter keeps concurrent retries from synchronising
+        wait = retry_after_seconds(r)
+        if wait is None:
+            wait = min(delay, 30) * (0.5 + random.random())
+        if attempt == 4 or loop.time() + wait > deadline:
+            break
+        await asyncio.sleep(wait)
         delay *= 2
     print("Evaluation POST failed after retries")
 
 # -------------------------------
 # ENDPOINTS
 # -------------------------------
-@app.post("/task")
-async def handle_task(request: TaskRequest):
-    verify_secret(request.secret)
-    # Log task
-    with open("task_log.jsonl", "a") as f:
-        f.write(f"{datetime.datetime.now().isoformat()} {request.model_dump_json()}\n")
-
-    # Round handling: find or create repo
-    repo = get_github_repo(request.task, request.email)
-    if not repo:
-        repo = create_github_repo(request.task, request.email)
-
-    # Generate files and push
-    files = generate_app_files(request.brief, request.attachments)
-    for path, content in files.items():
-        create_or_update_file(repo, path, content)
-
-    # Enable pages
-    pages_url = enable_github_pages(repo)
-
-    # Get latest commit SHA
+async def process_task(request: TaskRequest):
+    """Build and publish the app, then report to the evaluation URL"""
+    repo, commit_sha, pages_url = None, None, None
     try:
-        commit_sha = repo.get_commits()[0].sha
-    except:
-        commit_sha = None
+        # Round handling: find or create repo (PyGithub blocks, so use a thread)
+        repo, _ = await asyncio.to_thread(ensure_repo, request.task, request.email)
+
+        # Generate files, then push and enable pages concurrently
+        files = await generate_app_files(request.brief, request.attachments)
+        commit_sha, pages_url = await asyncio.gather(
+            push_files_to_repo(repo.full_name, files),
+            enable_github_pages(repo),
+            return_exceptions=True
+        )
+        if isinstance(commit_sha, Exception):
+            print("Push error:", commit_sha)
+            commit_sha = None
+    except Exception as e:
+        # The client already got 202; still report whatever we have
+        print("Task processing error:", e)
 
     # Post evaluation
     evaluation_payload = {
@@ -172,16 +540,22 @@ async def handle_task(request: TaskRequest):
         "task": request.task,
         "round": request.round,
         "nonce": request.nonce,
-        "repo_url": repo.html_url,
+        "repo_url": repo.html_url if repo else None,
         "commit_sha": commit_sha,
         "pages_url": pages_url
     }
-    post_evaluation(evaluation_payload, request.evaluation_url)
+    await post_evaluation(evaluation_payload, request.evaluation_url)
 
-    return {"status":"ok","message":"Task received successfully","repo_url":repo.html_url,"pages_url":pages_url}
+@app.post("/task", status_code=202)
+async def handle_task(http_request: Request, background_tasks: BackgroundTasks, request: TaskRequest = Depends(parse_task_request)):
+    verify_secret(request.secret)
+    # The body is cached on the Request after parsing, so this is not a second read
+    log_raw_event("task_log.jsonl", await http_request.body())
+    # Results are reported out-of-band to evaluation_url
+    background_tasks.add_task(process_task, request)
+    return {"status":"accepted","message":"Task received successfully"}
 
 @app.post("/evaluate")
 async def evaluate(request: EvaluateRequest):
-    with open("evaluation_log.jsonl", "a") as f:
-        f.write(f"{datetime.datetime.now().isoformat()} {request.model_dump_json()}\n")
+    log_event("evaluation_log.jsonl", request.model_dump())
     return {"status":"ok","message":"Evaluation recorded successfully"}